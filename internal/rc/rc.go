@@ -44,39 +44,43 @@ func BackupDir() string {
 	return DefaultBackupDir
 }
 
-// Ensure rc file exists
-func ensureFile() error {
+// Ensure rc file exists and return its path, so callers resolve it once.
+// The parent directory is only created when the file itself is missing, so
+// the common case costs a single stat.
+func ensureFile() (string, error) {
 	p := RCPath()
+	if _, err := os.Stat(p); !errors.Is(err, os.ErrNotExist) {
+		return p, nil
+	}
 	dir := filepath.Dir(p)
 	if dir == "" {
 		dir = "."
 	}
 	if err := os.MkdirAll(dir, 0o755); err != nil {
-		return err
+		return "", err
 	}
-	if _, err := os.Stat(p); errors.Is(err, os.ErrNotExist) {
-		f, err := os.OpenFile(p, os.O_CREATE, 0o644)
-		if err != nil {
-			return err
-		}
-		return f.Close()
+	f, err := os.OpenFile(p, os.O_CREATE, 0o644)
+	if err != nil {
+		return "", err
 	}
-	return nil
+	return p, f.Close()
 }
 
 func AddAlias(name, command string) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
 	line := fmt.Sprintf("alias %s='%s'\n", name, command)
-	return util.AppendFileAtomic(RCPath(), []byte(line))
+	return util.AppendFileAtomic(p, []byte(line))
 }
 
 func ListAliases(w io.Writer) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
-	f, err := os.Open(RCPath())
+	f, err := os.Open(p)
 	if err != nil {
 		return err
 	}
@@ -85,29 +89,32 @@ func ListAliases(w io.Writer) error {
 }
 
 func RemoveAlias(name string) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
 	prefix := "alias " + name + "="
-	return util.RemoveLinesWithPrefix(RCPath(), prefix)
+	return util.RemoveLinesWithPrefix(p, prefix)
 }
 
 func AddExport(varName, value string) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
 	if strings.Contains(value, " ") {
 		value = fmt.Sprintf("\"%s\"", value)
 	}
 	line := fmt.Sprintf("export %s=%s\n", varName, value)
-	return util.AppendFileAtomic(RCPath(), []byte(line))
+	return util.AppendFileAtomic(p, []byte(line))
 }
 
 func ListExports(w io.Writer) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
-	f, err := os.Open(RCPath())
+	f, err := os.Open(p)
 	if err != nil {
 		return err
 	}
@@ -116,11 +123,12 @@ func ListExports(w io.Writer) error {
 }
 
 func RemoveExport(varName string) error {
-	if err := ensureFile(); err != nil {
+	p, err := ensureFile()
+	if err != nil {
 		return err
 	}
 	prefix := "export " + varName + "="
-	return util.RemoveLinesWithPrefix(RCPath(), prefix)
+	return util.RemoveLinesWithPrefix(p, prefix)
 }
 
 func Backup(includeRC bool) error {
@@ -141,25 +149,30 @@ func Backup(includeRC bool) error {
 func Restore() error {
 	// Find latest rc backup in backup dir
 	dir := BackupDir()
-	pattern := filepath.Join(dir, filepath.Base(RCPath())+".bak.*")
+	rcPath := RCPath()
+	pattern := filepath.Join(dir, filepath.Base(rcPath)+".bak.*")
 	matches, _ := filepath.Glob(pattern)
 	if len(matches) == 0 {
 		return fmt.Errorf("no rc backup found in %s", dir)
 	}
 	latest := util.LatestFile(matches)
-	return util.CopyFile(latest, RCPath())
+	return util.CopyFile(latest, rcPath)
 }
 
-// scanning helper
+// scanning helper; output is buffered and flushed once at the end
 func scanPrintPrefix(r io.Reader, prefix string, w io.Writer) error {
 	sc := bufio.NewScanner(r)
+	bw := bufio.NewWriter(w)
 	for sc.Scan() {
 		line := sc.Text()
 		if strings.HasPrefix(strings.TrimSpace(line), prefix) {
-			if _, err := fmt.Fprintln(w, line); err != nil {
+			if _, err := fmt.Fprintln(bw, line); err != nil {
 				return err
 			}
 		}
 	}
-	return sc.Err()
+	if err := sc.Err(); err != nil {
+		return err
+	}
+	return bw.Flush()
 }
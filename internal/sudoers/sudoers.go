@@ -41,17 +41,21 @@ func List(w io.Writer) error {
 	}
 	defer f.Close()
 	sc := bufio.NewScanner(f)
+	bw := bufio.NewWriter(w)
 	for sc.Scan() {
 		line := sc.Text()
 		s := strings.TrimSpace(line)
 		if s == "" || strings.HasPrefix(s, "#") {
 			continue
 		}
-		if _, err := fmt.Fprintln(w, line); err != nil {
+		if _, err := fmt.Fprintln(bw, line); err != nil {
 			return err
 		}
 	}
-	return sc.Err()
+	if err := sc.Err(); err != nil {
+		return err
+	}
+	return bw.Flush()
 }
 
 func Add(entry string) error {
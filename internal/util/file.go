@@ -1,10 +1,10 @@
 package util
 
 import (
+	"bytes"
 	"io"
 	"os"
 	"path/filepath"
-	"sort"
 	"time"
 )
 
@@ -35,15 +35,10 @@ func RemoveLinesWithPrefix(path, prefix string) error {
 	if err != nil {
 		return err
 	}
-	lines := splitLines(string(b))
-	out := []string{}
-	for _, l := range lines {
-		if len(l) >= len(prefix) && l[:len(prefix)] == prefix {
-			continue
-		}
-		out = append(out, l)
-	}
-	return atomicWrite(path, []byte(joinLines(out)))
+	p := []byte(prefix)
+	return atomicWrite(path, filterLines(b, func(l []byte) bool {
+		return bytes.HasPrefix(l, p)
+	}))
 }
 
 func RemoveLinesContaining(path, pattern string) error {
@@ -51,31 +46,38 @@ func RemoveLinesContaining(path, pattern string) error {
 	if err != nil {
 		return err
 	}
-	lines := splitLines(string(b))
-	out := []string{}
-	for _, l := range lines {
-		if contains(l, pattern) {
-			continue
-		}
-		out = append(out, l)
-	}
-	return atomicWrite(path, []byte(joinLines(out)))
+	p := []byte(pattern)
+	return atomicWrite(path, filterLines(b, func(l []byte) bool {
+		return len(p) > 0 && bytes.Contains(l, p)
+	}))
 }
 
-func contains(s, sub string) bool {
-	return len(sub) > 0 && (len(s) >= len(sub) && (index(s, sub) >= 0))
-}
-
-// Helpers (simple to avoid imports)
-func splitLines(s string) []string {
-	if s == "" {
-		return []string{}
+// filterLines copies the "\n"-separated lines of b that drop rejects into a
+// single buffer sized for the input, without an intermediate slice of lines.
+func filterLines(b []byte, drop func(line []byte) bool) []byte {
+	out := make([]byte, 0, len(b))
+	if len(b) == 0 {
+		return out
+	}
+	first := true
+	for {
+		i := bytes.IndexByte(b, '\n')
+		line := b
+		if i >= 0 {
+			line = b[:i]
+		}
+		if !drop(line) {
+			if !first {
+				out = append(out, '\n')
+			}
+			out = append(out, line...)
+			first = false
+		}
+		if i < 0 {
+			return out
+		}
+		b = b[i+1:]
 	}
-	return stringsSplit(s, "\n")
-}
-
-func joinLines(lines []string) string {
-	return stringsJoin(lines, "\n")
 }
 
 func atomicWrite(path string, data []byte) error {
@@ -107,33 +109,40 @@ func CopyFile(src, dst string) error {
 	return out.Sync()
 }
 
+// CopyToTemp copies src into a new temp file with the same mode. The copy
+// goes file-to-file through io.Copy so the kernel can move the bytes
+// (copy_file_range on Linux) without a userspace buffer.
 func CopyToTemp(src string) (string, error) {
-	b, err := os.ReadFile(src)
+	in, err := os.Open(src)
 	if err != nil {
 		return "", err
 	}
+	defer in.Close()
 	f, err := os.CreateTemp("", "shctl_sudoers_*")
 	if err != nil {
 		return "", err
 	}
-	if _, err := f.Write(b); err != nil {
+	if _, err := io.Copy(f, in); err != nil {
 		f.Close()
 		return "", err
 	}
-	f.Close()
-	if fi, err := os.Stat(src); err == nil {
-		_ = os.Chmod(f.Name(), fi.Mode())
+	if fi, err := in.Stat(); err == nil {
+		_ = f.Chmod(fi.Mode())
 	}
+	f.Close()
 	return f.Name(), nil
 }
 
+// LatestFile returns the most recently modified file, stat-ing each path once.
 func LatestFile(files []string) string {
-	sort.Slice(files, func(i, j int) bool {
-		ti := modTime(files[i])
-		tj := modTime(files[j])
-		return ti.After(tj)
-	})
-	return files[0]
+	latest := files[0]
+	latestTime := modTime(latest)
+	for _, f := range files[1:] {
+		if t := modTime(f); t.After(latestTime) {
+			latest, latestTime = f, t
+		}
+	}
+	return latest
 }
 
 func modTime(path string) time.Time {